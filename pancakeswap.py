@@ -1,13 +1,23 @@
-import functools
+import asyncio
+import json
 import logging
 import os
+import requests
+import threading
 import time
 import utils
 
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from web3 import Web3
+from web3._utils.request import make_post_request
+from web3.eth import AsyncEth
+from web3.providers.async_rpc import AsyncHTTPProvider
 from web3.contract import ContractFunction
 from web3.types import Any, Wei, ChecksumAddress, TxParams, Nonce, HexBytes
-from typing import Union, Optional, Callable
+from typing import Union, Optional, Callable, Final
 from exceptions import InsufficientBalance
 from eth_typing import AnyAddress
 from eth_utils import is_same_address
@@ -16,6 +26,37 @@ from eth_utils import is_same_address
 logger = logging.getLogger(__name__)
 
 
+_session_lock = threading.Lock()
+_session_pool: dict = {}
+
+
+def _shared_session(provider_url: str) -> requests.Session:
+    """
+    Method returns a process-wide pooled requests.Session for the given provider
+    URL. Instances pointed at the same endpoint share kept-alive sockets, so RPC
+    calls skip the TCP/TLS handshake instead of paying it per request.
+
+    :param: provider_url - HTTP(S) endpoint of the JSON-RPC node
+
+    :returns: (requests.Session) shared session for that endpoint
+    """
+    with _session_lock:
+        session = _session_pool.get(provider_url)
+
+        if session is None:
+            adapter = HTTPAdapter(
+                pool_connections=16,
+                pool_maxsize=32,
+                max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[502, 503, 504]),
+            )
+            session = requests.Session()
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _session_pool[provider_url] = session
+
+        return session
+
+
 class Pancakeswap:
     """
         Pancakeswap is a wrapper class that provides functionality to interact with
@@ -23,6 +64,15 @@ class Pancakeswap:
         
         Supports only PancakeswapV2.
     """
+
+    # Uniswap V2 max-approval constants; the check threshold keeps the original
+    # 0x000...fff value used to decide an allowance still counts as maxed out
+    MAX_APPROVAL_INT: Final[int] = (1 << 256) - 1
+    MAX_APPROVAL_CHECK_INT: Final[int] = (1 << 196) - 1
+
+    # how long a fetched token balance may be reused before re-querying the node
+    BALANCE_TTL: Final[float] = 2.0
+
     def __init__(self, address: Union[str, AnyAddress], private_key: str, provider: str = None, 
         web3: Web3 = None, version:int = 2, max_slippage: float = 0.1) -> None:
         """
@@ -37,6 +87,9 @@ class Pancakeswap:
         """
 
         self.address: AnyAddress = utils.str_to_addr(address) if isinstance(address, str) else address
+        # validate once and keep the checksummed form so the trade path never
+        # converts the wallet address again
+        self.address_str: ChecksumAddress = utils.addr_to_str(self.address)
         self.private_key = private_key
         self.version = version
         self.max_slippage = max_slippage
@@ -45,74 +98,306 @@ class Pancakeswap:
             self.w3 = web3
         else:
             self.provider = provider or os.environ["PROVIDER"]
-            self.w3 = Web3(Web3.HTTPProvider(self.provider, request_kwargs={"timeout": 60}))
-        
-        self.last_nonce: Nonce = self.w3.eth.get_transaction_count(self.address)
+            self._session = _shared_session(self.provider)
+            self.w3 = Web3(Web3.HTTPProvider(self.provider, session=self._session, request_kwargs={"timeout": 60}))
+
+        # async twin of the provider, used to overlap independent read RPCs;
+        # only available when we know the endpoint URL ourselves
+        if getattr(self, "provider", None):
+            self.w3a = Web3(
+                AsyncHTTPProvider(self.provider, request_kwargs={"timeout": 60}),
+                modules={"eth": (AsyncEth,)},
+                middlewares=[],
+            )
+        else:
+            self.w3a = None
 
+        self._async_loop = None
+        self._async_loop_lock = threading.Lock()
         
         self.factory_address_v2 = utils.str_to_addr('0xcA143Ce32Fe78f1f7019d7d551a6402fC5350c73')
         self.router_address_v2  = utils.str_to_addr('0x10ED43C718714eb63d5aA57B78B54704E256024E')
+        self.multicall_address  = utils.str_to_addr('0xcA11bde05977b3631167028862bE2a173976CA11')
 
         self.factory = utils.load_contract("factory", self.factory_address_v2, self.w3)
         self.router = utils.load_contract("router02", self.router_address_v2, self.w3)
-    
-        self.max_approval_hex = f"0x{64 * 'f'}"
-        self.max_approval_int = int(self.max_approval_hex, 16)
-        self.max_approval_check_hex = f"0x{15 * '0'}{49 * 'f'}"
-        self.max_approval_check_int = int(self.max_approval_check_hex, 16)
+        self.multicall = utils.load_contract("multicall3", self.multicall_address, self.w3)
+
+        # bind the hot router functions once so the trade path does a plain
+        # attribute access instead of re-resolving each name through the ABI
+        self._swap_exact_eth_for_tokens = self.router.functions.swapExactETHForTokens
+        self._swap_exact_tokens_for_eth = self.router.functions.swapExactTokensForETHSupportingFeeOnTransferTokens
+        self._swap_exact_tokens_for_tokens = self.router.functions.swapExactTokensForTokens
+        self._get_amounts_out = self.router.functions.getAmountsOut
+
+        self._chain_id = self.w3.eth.chain_id
+
+        self._nonce_lock = threading.Lock()
+        # a persisted counter avoids the cold-start get_transaction_count RPC
+        # for short-lived clients; it cannot be trusted blindly (the file may be
+        # stale in either direction), so it is re-verified against the node the
+        # first time a nonce is actually handed out
+        nonce = self._load_persisted_nonce()
+        self._nonce_synced = nonce is None
+        if nonce is None:
+            nonce = self.w3.eth.get_transaction_count(self.address, "pending")
+        self._nonce: Nonce = nonce
+
+        self.weth: ChecksumAddress = Web3.toChecksumAddress('0xbb4CdB9CBd36B01bD1cBaEBF2De08d9173bc095c')
+        self._approved_tokens: set = set()
+        self._balance_cache: dict = {}
+
+
+
+    def _batch_call(self, calls: list) -> list:
+        """
+        Method sends several JSON-RPC requests to the node in a single HTTP POST
+        and returns their results in call order. Collapses N network round-trips
+        into 1 on remote providers.
+
+        :param: calls    - list of (method, params) tuples, e.g. ("eth_call", [...])
+
+        :returns: (list) raw JSON-RPC results, one per call, in the same order
+        """
+        provider = self.w3.provider
+        if not hasattr(provider, "endpoint_uri"):
+            # Non-HTTP providers can't batch; fall back to sequential requests,
+            # surfacing node errors the same way the batch path does
+            results = []
+            for method, params in calls:
+                response = provider.make_request(method, params)
+                if "error" in response:
+                    raise ValueError(response["error"])
+                results.append(response["result"])
+            return results
+
+        payload = [
+            {"jsonrpc": "2.0", "method": method, "params": params, "id": i}
+            for i, (method, params) in enumerate(calls)
+        ]
+        raw = make_post_request(
+            provider.endpoint_uri,
+            json.dumps(payload).encode("utf-8"),
+            **provider.get_request_kwargs(),
+        )
+
+        results = []
+        for response in sorted(json.loads(raw), key=itemgetter("id")):
+            if "error" in response:
+                raise ValueError(response["error"])
+            results.append(response["result"])
+
+        return results
+
+
+    def _decode_amounts_out(self, result: str) -> int:
+        """
+        Method decodes the raw return data of a 'getAmountsOut' eth_call and
+        returns the final amount in the path.
+
+        :param: result   - hex-encoded return data of the call
+
+        :returns: (int) amount of the last token in the path
+        """
+        return self.w3.codec.decode_abi(["uint256[]"], HexBytes(result))[0][-1]
+
+
+    def _nonce_file(self) -> str:
+        """
+        Method returns the path of the per-wallet nonce file under the user's
+        cache directory.
+
+        :returns: (str) path of the nonce file
+        """
+        return os.path.join(
+            os.path.expanduser("~/.cache/pancakeswap"),
+            f"nonce-{self._chain_id}-{self.address_str}.json",
+        )
+
+
+    def _load_persisted_nonce(self) -> Optional[Nonce]:
+        """
+        Method reads the nonce counter persisted by a previous process for this
+        wallet, or returns None when no usable file exists.
+
+        :returns: (Optional[Nonce]) persisted nonce counter
+        """
+        try:
+            with open(self._nonce_file()) as f:
+                return Nonce(max(int(json.load(f)), 0))
+        except (OSError, ValueError):
+            return None
+
+
+    def _persist_nonce(self) -> None:
+        """
+        Method writes the current nonce counter to the per-wallet cache file so
+        the next process starts without a get_transaction_count RPC.
+        """
+        path = self._nonce_file()
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "w") as f:
+                json.dump(int(self._nonce), f)
+        except OSError:
+            logger.debug("could not persist nonce to %s", path)
+
+
+    def _next_nonce(self) -> Nonce:
+        """
+        Method reserves the next nonce from the in-process counter, avoiding a
+        get_transaction_count RPC on every send. The counter is seeded once at
+        construction and only resynced with the node after a failed send.
+
+        :returns: (Nonce) nonce to use for the next transaction
+        """
+        with self._nonce_lock:
+            self._sync_nonce_locked()
+            nonce = self._nonce
+            self._nonce = Nonce(nonce + 1)
+
+        return nonce
+
+
+    def _sync_nonce_locked(self) -> None:
+        """
+        Method verifies a file-seeded counter against the node's pending count
+        before the first nonce is handed out: a stale-high value would queue
+        transactions that never mine and never trip the nonce-too-low retry.
+        The caller must hold _nonce_lock.
+        """
+        if not self._nonce_synced:
+            self._nonce = self.w3.eth.get_transaction_count(self.address, "pending")
+            self._nonce_synced = True
+
+
+    def _resync_nonce(self) -> None:
+        """
+        Method re-seeds the local nonce counter from the node's pending state.
+        """
+        with self._nonce_lock:
+            self._nonce = self.w3.eth.get_transaction_count(self.address, "pending")
+            self._nonce_synced = True
+        self._persist_nonce()
+
+
+    def _build_raw_tx(self, function: ContractFunction, tx_params: TxParams) -> dict:
+        """
+        Method hand-builds the transaction dict for a contract call from its
+        pre-encoded calldata, skipping web3's buildTransaction machinery (param
+        merging, validation and the gas-estimation fallback). Gas and value are
+        always supplied by the callers, so none of that work is needed.
+
+        :param: function     - Instance of contract function to encode
+        :param: tx_params    - Defined transaction parameters in a dictionary
+
+        :returns: (dict) transaction ready to sign
+        """
+        transaction = dict(tx_params)
+        transaction["to"] = function.address
+        transaction["data"] = function._encode_transaction_data()
+        transaction.setdefault("chainId", self._chain_id)
+        if "gasPrice" not in transaction:
+            transaction["gasPrice"] = self.w3.eth.gas_price
+
+        return transaction
+
+
+    def _sign_and_send(self, function: ContractFunction, tx_params: TxParams, private_key: str) -> HexBytes:
+        """
+        Method builds, signs and sends a transaction. If the node rejects the
+        locally tracked nonce (e.g. another client used the wallet), the counter
+        is resynced from the node and the send is retried once.
+
+        :param: function     - Instance of contract function to build the transaction from
+        :param: tx_params    - Defined transaction parameters in a dictionary
+        :param: private_key  - User's wallet private key
+
+        :returns: (HexBytes)
+        """
+        transaction = self._build_raw_tx(function, tx_params)
+        signed_txn = self.w3.eth.account.sign_transaction(
+            transaction, private_key=private_key
+        )
+
+        try:
+            tx = self.w3.eth.send_raw_transaction(signed_txn.rawTransaction)
+            self._persist_nonce()
+            return tx
+        except ValueError as e:
+            message = str(e).lower()
+            if "known transaction" in message:
+                # the original already sits in the mempool; re-sending under a
+                # fresh nonce would execute the call twice
+                return signed_txn.hash
+            if "nonce too low" not in message:
+                raise
+
+            self._resync_nonce()
+            tx_params["nonce"] = self._next_nonce()
+            transaction = self._build_raw_tx(function, tx_params)
+            signed_txn = self.w3.eth.account.sign_transaction(
+                transaction, private_key=private_key
+            )
+            tx = self.w3.eth.send_raw_transaction(signed_txn.rawTransaction)
+            self._persist_nonce()
+            return tx
+        finally:
+            logger.debug("nonce: %s", tx_params["nonce"])
 
 
     def _build_and_send_approval(self, function: ContractFunction) -> HexBytes:
         """Build and send a transaction."""
         params = {
-            "from": utils.addr_to_str(self.address),
+            "from": self.address_str,
             "value": Wei(0),
             "gas": Wei(250000),
-            "nonce": max(
-                self.last_nonce, self.w3.eth.getTransactionCount(self.address)
-            ),
-        } 
+            "chainId": self._chain_id,
+            "nonce": self._next_nonce(),
+        }
 
-        transaction = function.buildTransaction(params)
-        
-        signed_txn = self.w3.eth.account.sign_transaction(
-            transaction, private_key=self.private_key
-        )
-        
-        try:
-            return self.w3.eth.sendRawTransaction(signed_txn.rawTransaction)
-        finally:
-            logger.debug(f"nonce: {params['nonce']}")
-            self.last_nonce = Nonce(params["nonce"] + 1)
+        return self._sign_and_send(function, params, self.private_key)
 
 
-    def _eth_to_token_swap_input(self,gwei, my_address, my_pk, output_token: AnyAddress, qty: Wei, recipient: Optional[AnyAddress]) -> HexBytes:
+    def _eth_to_token_swap_input(self,gwei, my_address, my_pk, output_token: AnyAddress, qty: Wei, recipient: Optional[AnyAddress], price: Optional[int] = None) -> HexBytes:
         """Convert base token (BSC for Binance Smart Chain | ETH for Ethereum) to tokens given an input amount.
-        
+
         :param: gwei         - Amount of gas for trade/transaction (1 ETH = 10^9 gwei)
         :param: my_address   - User's wallet address
         :param: my_pk        - User's wallet private key
         :param: output_token - address of token received as result of swapped
         :param: qty          - Quantity of input_token to swap
         :param: recipient    - Wallet address of recipient of swap, if None defaults to my_address
-        
+        :param: price        - Pre-fetched quote for the swap; when set the balance check
+                               and quote were already done by make_trade in one batch
+
         :returns:            -
         """
 
-        # Validate my_address holds enough 
-        eth_balance = self.get_eth_balance()
-        if qty > eth_balance:
-            raise InsufficientBalance(eth_balance, qty)
+        if price is None:
+            # Validate my_address holds enough; overlap the two reads through
+            # the async provider when possible
+            if self._can_gather():
+                eth_balance, price = self._gather(
+                    self.aget_eth_balance(),
+                    self.aget_eth_token_input_price(output_token, qty),
+                )
+            else:
+                eth_balance = self.get_eth_balance()
+                price = self.get_eth_token_input_price(output_token, qty)
+
+            if qty > eth_balance:
+                raise InsufficientBalance(eth_balance, qty)
 
         if recipient is None:
             recipient = self.address
-        
-        amount_out_min = int( (1 - self.max_slippage) * self.get_eth_token_input_price(output_token, qty) )
-        
+
+        amount_out_min = int( (1 - self.max_slippage) * price )
+
         return self._build_and_send_tx(gwei, my_address, my_pk,
-            self.router.functions.swapExactETHForTokens(
+            self._swap_exact_eth_for_tokens(
                 amount_out_min,
-                [self.get_weth_address(), output_token],
+                [self.weth, output_token],
                 recipient,
                 self._deadline(),
             ),
@@ -120,7 +405,7 @@ class Pancakeswap:
         )
 
 
-    def _token_to_eth_swap_input(self, gwei, my_address, my_pk, input_token: AnyAddress, qty: int, recipient: Optional[AnyAddress]) -> HexBytes:
+    def _token_to_eth_swap_input(self, gwei, my_address, my_pk, input_token: AnyAddress, qty: int, recipient: Optional[AnyAddress], price: Optional[int] = None) -> HexBytes:
         """
         Method that provides functionality to convert input_token to BNB given an input amount (qty).
 
@@ -130,23 +415,27 @@ class Pancakeswap:
         :param: input_token  - Address of token user wishes to swap
         :param: qty          - Quantity of input_token to swap
         :param: recipient    - Wallet address of recipient of swap, if None defaults to my_address
+        :param: price        - Pre-fetched quote for the swap, batched by make_trade
 
         :returns: (HexBytes)
         """
-        # Balance check
-        input_balance = self.get_token_balance(input_token)
-        if qty > input_balance:
-            raise InsufficientBalance(input_balance, qty)
+        if price is None:
+            # Balance check
+            input_balance = self.get_token_balance(input_token)
+            if qty > input_balance:
+                raise InsufficientBalance(input_balance, qty)
+
+            price = self.get_token_eth_input_price(input_token, qty)
 
         if recipient is None:
             recipient = self.address
-        amount_out_min = int( (1 - self.max_slippage) * self.get_token_eth_input_price(input_token, qty) )
-        
+        amount_out_min = int( (1 - self.max_slippage) * price )
+
         return self._build_and_send_tx(gwei, my_address,my_pk,
-            self.router.functions.swapExactTokensForETHSupportingFeeOnTransferTokens(
+            self._swap_exact_tokens_for_eth(
                 qty,
                 amount_out_min,
-                [input_token, self.get_weth_address()],
+                [input_token, self.weth],
                 recipient,
                 self._deadline(),
             )
@@ -154,9 +443,9 @@ class Pancakeswap:
 
 
     def _token_to_token_swap_input(self, gwei, my_address, my_pk, input_token: AnyAddress,
-        qty: int, output_token: AnyAddress, recipient: Optional[AnyAddress],) -> HexBytes:
+        qty: int, output_token: AnyAddress, recipient: Optional[AnyAddress], price: Optional[int] = None) -> HexBytes:
         """
-        Method that provides functionality to convert input_token 
+        Method that provides functionality to convert input_token
         given output_token provided an input amount (qty).
 
         :param: gwei         - Amount of gas for trade/transaction (1 ETH = 10^9 gwei)
@@ -166,19 +455,23 @@ class Pancakeswap:
         :param: qty          - Quantity of input_token to swap
         :param: output_token - Address of token user wishes to receive as a result of swap
         :param: recipient    - Wallet address of recipient of swap, if None defaults to my_address
+        :param: price        - Pre-fetched quote for the swap, batched by make_trade
 
         :returns: (HexBytes)
         """
         if recipient is None:
             recipient = self.address
 
-        min_tokens_bought = int( (1 - self.max_slippage) * self.get_token_token_input_price(input_token, output_token, qty) )
-        
+        if price is None:
+            price = self.get_token_token_input_price(input_token, output_token, qty)
+
+        min_tokens_bought = int( (1 - self.max_slippage) * price )
+
         return self._build_and_send_tx(gwei, my_address,my_pk,
-            self.router.functions.swapExactTokensForTokens(
+            self._swap_exact_tokens_for_tokens(
                 qty,
                 min_tokens_bought,
-                [input_token, self.get_weth_address(), output_token],
+                [input_token, self.weth, output_token],
                 recipient,
                 self._deadline(),
             ),
@@ -199,16 +492,8 @@ class Pancakeswap:
         """
         if not tx_params:
             tx_params = self._get_tx_params(gwei,my_address)
-        
-        transaction = function.buildTransaction(tx_params)
-        signed_txn = self.w3.eth.account.sign_transaction(
-            transaction, private_key=my_pk
-        )
-        try:
-            return self.w3.eth.send_raw_transaction(signed_txn.rawTransaction)
-        finally:
-            logger.debug(f"nonce: {tx_params['nonce']}")
-            self.last_nonce = Nonce(tx_params["nonce"] + 1)
+
+        return self._sign_and_send(function, tx_params, my_pk)
 
 
     def _get_tx_params(self, gwei, my_address, value: Wei = Wei(0), gas: Wei = Wei(250000)) -> TxParams:
@@ -225,9 +510,8 @@ class Pancakeswap:
             "value": value,
             "gas": gas,
             "gasPrice":gwei,
-            "nonce": max(
-                self.last_nonce, self.w3.eth.get_transaction_count(self.address)
-            ),
+            "chainId": self._chain_id,
+            "nonce": self._next_nonce(),
         }
 
 
@@ -243,16 +527,23 @@ class Pancakeswap:
 
     def _is_approved(self, token: AnyAddress) -> bool:
         """Check to see if the exchange and token is approved."""
-        utils.validate_address(token)
+        token_str = utils.addr_to_str(token)
+
+        # max approval never decreases on its own, so once observed it is
+        # remembered and the allowance RPC is skipped on later checks
+        if token_str in self._approved_tokens:
+            return True
+
         contract_addr = self.router_address_v2
-        
+
         amount = (
             utils.load_contract("erc20", token, self.w3)
             .functions.allowance(self.address, contract_addr)
             .call()
         )
-        
-        if amount >= self.max_approval_check_int:
+
+        if amount >= self.MAX_APPROVAL_CHECK_INT:
+            self._approved_tokens.add(token_str)
             return True
         else:
             return False
@@ -267,14 +558,125 @@ class Pancakeswap:
         return self.w3.eth.get_balance(self.address)
     
 
-    @functools.lru_cache()
+    def _can_gather(self) -> bool:
+        """
+        Method reports whether independent reads can be overlapped through the
+        async provider: one must exist and no event loop may already be running
+        on this thread (blocking on the gather would stall that loop).
+
+        :returns: (bool)
+        """
+        if self.w3a is None:
+            return False
+
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return True
+
+        return False
+
+
+    def _ensure_async_loop(self) -> asyncio.AbstractEventLoop:
+        """
+        Method lazily starts one long-lived event loop on a daemon thread. The
+        loop must outlive individual gathers because the async provider caches
+        its aiohttp session against it; a per-call asyncio.run would close the
+        loop and leave the cached session unusable.
+
+        :returns: (asyncio.AbstractEventLoop) the running background loop
+        """
+        with self._async_loop_lock:
+            if self._async_loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, daemon=True).start()
+                self._async_loop = loop
+
+            return self._async_loop
+
+
+    def _gather(self, *coros: Any) -> list:
+        """
+        Method runs several coroutines concurrently on the background loop and
+        returns their results in order.
+
+        :param: coros    - coroutines to await concurrently
+
+        :returns: (list) results, one per coroutine, in input order
+        """
+        async def runner() -> list:
+            return await asyncio.gather(*coros)
+
+        loop = self._ensure_async_loop()
+
+        return asyncio.run_coroutine_threadsafe(runner(), loop).result()
+
+
+    async def aget_eth_balance(self) -> Wei:
+        """
+        Async variant of get_eth_balance, resolved through the async provider.
+
+        :returns: (Wei) balance of ETH in wallet
+        """
+        return await self.w3a.eth.get_balance(self.address_str)
+
+
+    async def aget_token_balance(self, token: AnyAddress) -> int:
+        """
+        Async variant of get_token_balance, resolved through the async provider.
+
+        :param: token    - Contract address of token
+
+        :returns: (int) number of tokens
+        """
+        erc20 = utils.load_contract("erc20", token, self.w3)
+        balance_data = erc20.functions.balanceOf(self.address)._encode_transaction_data()
+        result = await self.w3a.eth.call({"to": utils.addr_to_str(token), "data": balance_data})
+
+        return int.from_bytes(HexBytes(result), "big")
+
+
+    async def aget_eth_token_input_price(self, token: AnyAddress, qty: int) -> int:
+        """
+        Async variant of get_eth_token_input_price, resolved through the async
+        provider.
+
+        :param: token    - address of token to receive as result of swap
+        :param: qty      - Quantity of ETH to swap
+
+        :returns: (int)
+        """
+        amounts_data = self._get_amounts_out(
+            qty, [self.weth, token]
+        )._encode_transaction_data()
+        result = await self.w3a.eth.call(
+            {"to": utils.addr_to_str(self.router_address_v2), "data": amounts_data}
+        )
+
+        return self._decode_amounts_out(result)
+
+
     def get_weth_address(self) -> ChecksumAddress:
         """
         Method returns the contract address of WBNB
         """
-        address = Web3.toChecksumAddress('0xbb4CdB9CBd36B01bD1cBaEBF2De08d9173bc095c')
-        
-        return address
+        return self.weth
+
+
+    def _cached_balance(self, token_str: str) -> Optional[int]:
+        """
+        Method returns the cached balance of a token, or None when the entry is
+        missing or older than BALANCE_TTL.
+
+        :param: token_str - Checksummed contract address of token
+
+        :returns: (Optional[int]) cached number of tokens, if still fresh
+        """
+        hit = self._balance_cache.get(token_str)
+        if hit is not None and hit[0] > time.monotonic():
+            return hit[1]
+
+        return None
 
 
     def get_token_balance(self, token: AnyAddress) -> int:
@@ -284,16 +686,42 @@ class Pancakeswap:
 
         :returns: (int) number of tokens
         """
-        utils.validate_address(token)
-        if utils.addr_to_str(token) == utils.ETH_ADDRESS:
+        token_str = utils.addr_to_str(token)
+        if token_str == utils.ETH_ADDRESS:
             return self.get_eth_balance()
-        
+
+        balance = self._cached_balance(token_str)
+        if balance is not None:
+            return balance
+
         erc20 = utils.load_contract("erc20", token, self.w3)
-        balance: int = erc20.functions.balanceOf(self.address).call()
-        
+        balance = erc20.functions.balanceOf(self.address).call()
+        self._balance_cache[token_str] = (time.monotonic() + self.BALANCE_TTL, balance)
+
         return balance
 
 
+    def get_token_balance_at_least(self, token: AnyAddress, qty: int) -> bool:
+        """
+        Method checks whether the wallet holds at least qty of token. When a
+        recently cached balance already covers qty, the node is not queried at
+        all.
+
+        :param: token    - Contract address of token
+        :param: qty      - Quantity of token required
+
+        :returns: (bool) True when the balance covers qty
+        """
+        token_str = utils.addr_to_str(token)
+        if token_str != utils.ETH_ADDRESS:
+            cached = self._cached_balance(token_str)
+            if cached is not None and cached >= qty:
+                return True
+
+        return self.get_token_balance(token) >= qty
+
+
+    @utils.ttl_cache(3)
     def get_eth_token_input_price(self, token: AnyAddress, qty: int) -> int:
         """
         Uses the Pancakeswap router function 'getAmountsOut' to retrieve the price
@@ -304,14 +732,39 @@ class Pancakeswap:
 
         :returns: (Wei)  -
         """
-        price = self.router.functions.getAmountsOut(
+        price = self._get_amounts_out(
             qty, 
-            [self.get_weth_address(), token]
+            [self.weth, token]
         ).call()[-1]
         
         return price
 
 
+    def get_eth_token_input_prices(self, tokens: list, qty: int) -> list:
+        """
+        Uses the Multicall3 contract to resolve ETH to Token 'getAmountsOut'
+        quotes for many tokens in a single eth_call, instead of one network
+        round-trip per token.
+
+        :param: tokens   - addresses of tokens to quote against
+        :param: qty      - Quantity of ETH to swap in each quote
+
+        :returns: (list) price per token, in input order
+        """
+        weth = self.weth
+        router = utils.addr_to_str(self.router_address_v2)
+
+        calls = [
+            (router, HexBytes(self._get_amounts_out(qty, [weth, token])._encode_transaction_data()))
+            for token in tokens
+        ]
+
+        _, return_data = self.multicall.functions.aggregate(calls).call()
+
+        return [self._decode_amounts_out(rd) for rd in return_data]
+
+
+    @utils.ttl_cache(3)
     def get_token_eth_input_price(self, token: AnyAddress, qty: int) -> int:
         """
         Uses the Pancakeswap router function 'getAmountsOut' to retrieve the price
@@ -322,14 +775,15 @@ class Pancakeswap:
 
         :returns: (int)  -
         """
-        price = self.router.functions.getAmountsOut(
+        price = self._get_amounts_out(
             qty, 
-            [token, self.get_weth_address()]
+            [token, self.weth]
         ).call()[-1]
 
         return price
 
 
+    @utils.ttl_cache(3)
     def get_token_token_input_price(self, token0: AnyAddress, token1: AnyAddress, qty: int) -> int:
         """
         Uses the Pancakeswap router function 'getAmountsOut' to retrieve the price
@@ -341,16 +795,13 @@ class Pancakeswap:
 
         :returns: (int)
         """
-        print(f"Factory address: {self.factory_address_v2}")
-        print(f"Router address: {self.router_address_v2}")
-        
-        if is_same_address(token0, self.get_weth_address()):
+        if is_same_address(token0, self.weth):
             return int(self.get_eth_token_input_price(token1, qty))
-        elif is_same_address(token1, self.get_weth_address()):
+        elif is_same_address(token1, self.weth):
             return int(self.get_token_eth_input_price(token0, qty))
 
-        price: int = self.router.functions.getAmountsOut(
-            qty, [token0, self.get_weth_address(), token1]
+        price: int = self._get_amounts_out(
+            qty, [token0, self.weth, token1]
         ).call()[-1]
 
         return price
@@ -372,24 +823,172 @@ class Pancakeswap:
         :returns: TO-DO 
         """
 
+        weth = self.weth
+        router = utils.addr_to_str(self.router_address_v2)
+
         if input_token == utils.ETH_ADDRESS:
             # input_token is base network base token
-            return self._eth_to_token_swap_input(gwei, my_address, my_pk, output_token, Wei(qty), recipient)
+            # fetch the ETH balance and the swap quote in a single batched round-trip
+            amounts_data = self._get_amounts_out(
+                qty, [weth, output_token]
+            )._encode_transaction_data()
+            balance_hex, amounts_out = self._batch_call([
+                ("eth_getBalance", [self.address_str, "latest"]),
+                ("eth_call", [{"to": router, "data": amounts_data}, "latest"]),
+            ])
+
+            eth_balance = Wei(int(balance_hex, 16))
+            if qty > eth_balance:
+                raise InsufficientBalance(eth_balance, qty)
+
+            price = self._decode_amounts_out(amounts_out)
+            return self._eth_to_token_swap_input(gwei, my_address, my_pk, output_token, Wei(qty), recipient, price=price)
         else:
-            # validate we have enough input_token balance to cover input 'qty' for swap
-            balance = self.get_token_balance(input_token)
-            if balance < qty:
-                raise InsufficientBalance(balance, qty)
-            
+            # validate we have enough input_token balance to cover input 'qty'
+            # for swap; a warm balance cache answers this with no RPC at all
+            if not self.get_token_balance_at_least(input_token, qty):
+                raise InsufficientBalance(self.get_token_balance(input_token), qty)
+
+            input_str = utils.addr_to_str(input_token)
             if output_token == utils.ETH_ADDRESS:
-                return self._token_to_eth_swap_input(gwei, my_address, my_pk, input_token, qty, recipient)
+                tx = self._token_to_eth_swap_input(gwei, my_address, my_pk, input_token, qty, recipient)
             else:
-                return self._token_to_token_swap_input(gwei, my_address, my_pk, input_token, qty, output_token, recipient)
+                tx = self._token_to_token_swap_input(gwei, my_address, my_pk, input_token, qty, output_token, recipient)
+
+            # the swap spends input_token, so force a fresh read on the next query
+            self._balance_cache.pop(input_str, None)
+            return tx
+
+
+    def _swap_function(self, input_token: AnyAddress, output_token: AnyAddress, qty: Union[int, Wei],
+        recipient: Optional[AnyAddress]) -> tuple:
+        """
+        Method resolves the router swap function and call value for a trade
+        without sending it, mirroring the dispatch logic of make_trade.
+
+        :param: input_token  - address of input token (token to be swapped)
+        :param: output_token - address of token received as result of swap
+        :param: qty          - Quantity of input_token to swap
+        :param: recipient    - Wallet address of recipient of swap, if None defaults to my_address
+
+        :returns: (ContractFunction, Wei) function ready to build, and the tx value
+        """
+        if recipient is None:
+            recipient = self.address
+
+        if input_token == utils.ETH_ADDRESS:
+            amount_out_min = int( (1 - self.max_slippage) * self.get_eth_token_input_price(output_token, qty) )
+            function = self._swap_exact_eth_for_tokens(
+                amount_out_min,
+                [self.weth, output_token],
+                recipient,
+                self._deadline(),
+            )
+            return function, Wei(qty)
+
+        if output_token == utils.ETH_ADDRESS:
+            amount_out_min = int( (1 - self.max_slippage) * self.get_token_eth_input_price(input_token, qty) )
+            function = self._swap_exact_tokens_for_eth(
+                qty,
+                amount_out_min,
+                [input_token, self.weth],
+                recipient,
+                self._deadline(),
+            )
+            return function, Wei(0)
+
+        amount_out_min = int( (1 - self.max_slippage) * self.get_token_token_input_price(input_token, output_token, qty) )
+        function = self._swap_exact_tokens_for_tokens(
+            qty,
+            amount_out_min,
+            [input_token, self.weth, output_token],
+            recipient,
+            self._deadline(),
+        )
+        return function, Wei(0)
+
+
+    def make_trade_async(self, trades: list, wait: bool = False) -> list:
+        """
+        Method builds, signs and dispatches several trades without waiting for a
+        receipt between them. A contiguous nonce range is reserved locally in one
+        step, all transactions are signed sequentially, and the
+        send_raw_transaction calls are dispatched concurrently so the node can
+        accept the whole pipeline into its mempool within roughly one round-trip
+        each.
+
+        Each trade is a dict with the same keys as make_trade's parameters:
+        'input_token', 'output_token', 'qty', 'gwei' and optionally 'recipient'.
+        Input tokens are assumed to already be approved (see approve()); no
+        balance or approval checks are made on this path.
+
+        :param: trades   - list of trade dicts, see above
+        :param: wait     - when True, block until every transaction has a receipt
+
+        :returns: (list) transaction hashes (HexBytes), one per trade, in order
+        """
+        with self._nonce_lock:
+            self._sync_nonce_locked()
+            start = self._nonce
+            self._nonce = Nonce(start + len(trades))
+
+        built = []
+        for i, trade in enumerate(trades):
+            function, value = self._swap_function(
+                trade["input_token"], trade["output_token"], trade["qty"], trade.get("recipient")
+            )
+            tx_params: TxParams = {
+                "from": self.address_str,
+                "value": value,
+                "gas": Wei(250000),
+                "gasPrice": trade["gwei"],
+                "chainId": self._chain_id,
+                "nonce": Nonce(start + i),
+            }
+            signed_txn = self.w3.eth.account.sign_transaction(
+                self._build_raw_tx(function, tx_params), private_key=self.private_key
+            )
+            built.append((function, tx_params, signed_txn))
+
+        def dispatch(function: ContractFunction, tx_params: TxParams, signed_txn: Any) -> HexBytes:
+            try:
+                return self.w3.eth.send_raw_transaction(signed_txn.rawTransaction)
+            except ValueError as e:
+                message = str(e).lower()
+                if "known transaction" in message:
+                    # the original already sits in the mempool; re-sending under
+                    # a fresh nonce would execute the swap twice
+                    return signed_txn.hash
+                if "nonce too low" not in message:
+                    raise
+
+                # only the affected trade is re-signed and re-sent; resync from
+                # the node first so the retry uses the real pending count rather
+                # than the counter's next value, which is already past the
+                # reserved range. The other in-flight transactions keep theirs
+                self._resync_nonce()
+                tx_params["nonce"] = self._next_nonce()
+                retry = self.w3.eth.account.sign_transaction(
+                    self._build_raw_tx(function, tx_params), private_key=self.private_key
+                )
+                return self.w3.eth.send_raw_transaction(retry.rawTransaction)
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            futures = [pool.submit(dispatch, *args) for args in built]
+            tx_hashes = [future.result() for future in futures]
+
+        self._persist_nonce()
+
+        if wait:
+            for tx_hash in tx_hashes:
+                self.w3.eth.wait_for_transaction_receipt(tx_hash, timeout=6000)
+
+        return tx_hashes
 
 
     def approve(self, token: AnyAddress, max_approval: Optional[int] = None) -> None:
         """Give an exchange/router max approval of a token."""
-        max_approval = self.max_approval_int if not max_approval else max_approval
+        max_approval = self.MAX_APPROVAL_INT if not max_approval else max_approval
         
         contract_addr = (
             self.router_address_v2
@@ -399,11 +998,13 @@ class Pancakeswap:
             contract_addr, max_approval
         )
 
-        logger.info(f"Approving {utils.addr_to_str(token)}...")
+        logger.info("Approving %s...", utils.addr_to_str(token))
         
         tx = self._build_and_send_approval(function)
-        self.w3.eth.wait_for_transaction_receipt(tx, timeout=6000)
-
-        time.sleep(1)
+        # the receipt already guarantees inclusion; reads on this provider will
+        # see the post-mined allowance, so no settling delay is needed
+        receipt = self.w3.eth.wait_for_transaction_receipt(tx, timeout=6000)
+        if not receipt["status"]:
+            raise ValueError(f"Approval transaction reverted: {tx.hex()}")
 
     
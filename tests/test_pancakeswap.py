@@ -132,6 +132,25 @@ class TestPancakeswap(object):
         assert price
 
     
+    def test_make_trade_async(self, client: Pancakeswap, web3: Web3):
+        trades = [
+            {"input_token": self.bnb, "output_token": self.dai, "qty": self.ONE_BNB, "gwei": 100},
+            {"input_token": self.bnb, "output_token": self.usdc, "qty": self.ONE_BNB, "gwei": 100},
+        ]
+
+        tx_hashes = client.make_trade_async(trades, wait=True)
+
+        assert len(tx_hashes) == len(trades)
+        for txid in tx_hashes:
+            tx = web3.eth.wait_for_transaction_receipt(txid)
+            assert tx.status
+
+    def test_get_eth_token_input_prices(self, client: Pancakeswap):
+        prices = client.get_eth_token_input_prices([self.dai, self.usdc], self.ONE_BNB)
+
+        assert len(prices) == 2
+        assert all(prices)
+
     @pytest.mark.parametrize(
         "input_token, output_token, qty, recipient, expectation",
         [
@@ -159,7 +178,7 @@ class TestPancakeswap(object):
             bal_in_before = client.get_token_balance(input_token)
 
             txid = client.make_trade(input_token, output_token, qty, 100, ganache.address, ganache.pk, recipient)
-            tx = web3.eth.waitForTransactionReceipt(txid)
+            tx = web3.eth.wait_for_transaction_receipt(txid)
             assert tx.status
 
             # TODO: Checks for ETH, taking gas into account
@@ -0,0 +1,74 @@
+import logging
+import pytest
+
+from time import sleep
+from exceptions import InvalidToken
+from utils import ttl_cache, load_abi, str_to_addr, addr_to_str
+
+
+logger = logging.getLogger(__name__)
+
+
+class TestUtils(object):
+    wbnb = "0xbb4CdB9CBd36B01bD1cBaEBF2De08d9173bc095c"
+
+    def test_addr_to_str_checksums_and_caches(self):
+        first = addr_to_str(self.wbnb.lower())
+        second = addr_to_str(self.wbnb)
+
+        assert first == self.wbnb
+        assert first is second
+
+    def test_addr_to_str_round_trips_bytes(self):
+        addr = str_to_addr(self.wbnb)
+
+        assert str_to_addr(self.wbnb) is addr
+        assert addr_to_str(addr) == self.wbnb
+
+    def test_addr_to_str_rejects_non_hex(self):
+        with pytest.raises(InvalidToken):
+            addr_to_str("btc")
+
+    def test_ttl_cache_reuses_value_within_ttl(self):
+        calls = []
+
+        @ttl_cache(60)
+        def quote(token, qty):
+            calls.append((token, qty))
+            return len(calls)
+
+        assert quote("0xtoken", 1) == 1
+        assert quote("0xtoken", 1) == 1
+        assert quote("0xtoken", 2) == 2
+        assert len(calls) == 2
+
+    def test_load_abi_parses_once_per_name(self):
+        first = load_abi("erc20")
+        second = load_abi("erc20")
+
+        assert first is second
+
+    def test_ttl_cache_prunes_expired_entries(self):
+        @ttl_cache(0.05)
+        def quote(token, qty):
+            return qty
+
+        quote("0xtoken", 1)
+        quote("0xtoken", 2)
+        sleep(0.06)
+        quote("0xtoken", 3)
+
+        assert len(quote.cache) == 1
+
+    def test_ttl_cache_expires_after_ttl(self):
+        calls = []
+
+        @ttl_cache(0.05)
+        def quote(token, qty):
+            calls.append((token, qty))
+            return len(calls)
+
+        assert quote("0xtoken", 1) == 1
+        sleep(0.06)
+        assert quote("0xtoken", 1) == 2
+        assert len(calls) == 2
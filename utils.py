@@ -1,5 +1,6 @@
 import os
-import json
+import time
+import orjson
 import functools
 
 from typing import Callable
@@ -17,39 +18,107 @@ def validate_address(a: AnyAddress) -> None:
     assert addr_to_str(a)
 
 
+_contract_cache: dict = {}
+
+
 def load_contract(abi_name: str, address: AnyAddress, w3: Web3) -> Contract:
-    return w3.eth.contract(address=address, abi=load_abi(abi_name))
+    # Contract objects are cached per (abi, address, w3) so repeat lookups skip
+    # web3's contract factory, which rebuilds the ABI decoders on every call
+    key = (abi_name, address, id(w3))
+    contract = _contract_cache.get(key)
+
+    if contract is None:
+        contract = w3.eth.contract(address=address, abi=load_abi(abi_name))
+        _contract_cache[key] = contract
 
+    return contract
 
+
+@functools.lru_cache(maxsize=None)
 def load_abi(name: str) -> str:
     path = f"{os.path.dirname(os.path.abspath(__file__))}/abis/"
-    
-    with open(os.path.abspath(path + f"{name}.abi")) as f:
-        abi: str = json.load(f)
+
+    with open(os.path.abspath(path + f"{name}.abi"), "rb") as f:
+        abi = orjson.loads(f.read())
 
     return abi
 
 
+# Conversion results are cached so the hot paths (_is_approved,
+# get_token_balance, check_approval) do a dict lookup instead of re-running
+# keccak for the checksum on every call
+_addr_cache: dict = {}
+_checksum_cache: dict = {}
+
+
 def str_to_addr(s: str) -> AnyAddress:
     if s.startswith("0x"):
-        return Address(bytes.fromhex(s[2:]))
+        addr = _addr_cache.get(s)
+        if addr is None:
+            addr = Address(bytes.fromhex(s[2:]))
+            _addr_cache[s] = addr
+        return addr
     else:
         raise Exception("Could't convert string {s} to AnyAddress")
 
 
 def addr_to_str(a: AnyAddress, ) -> str:
     if isinstance(a, bytes):
-        addr: str = Web3.toChecksumAddress("0x" + bytes(a).hex())
+        key = bytes(a)
+        addr = _checksum_cache.get(key)
+        if addr is None:
+            addr = Web3.toChecksumAddress("0x" + key.hex())
+            _checksum_cache[key] = addr
         return addr
 
     elif isinstance(a, str):
         if a.startswith("0x"):
-            addr = Web3.toChecksumAddress(a)
+            key = a.lower()
+            addr = _checksum_cache.get(key)
+            if addr is None:
+                addr = Web3.toChecksumAddress(a)
+                _checksum_cache[key] = addr
             return addr
         else:
             raise InvalidToken(a)
 
 
+def ttl_cache(seconds: float) -> Callable:
+    """
+    Decorator that caches a function's return value for `seconds`, keyed by its
+    arguments. Expiry uses the monotonic clock, so repeated RPC reads (e.g. price
+    quotes inside a quoting loop) are served from memory instead of re-hitting
+    the node.
+    """
+    def decorator(method: Callable) -> Callable:
+        cache: dict = {}
+
+        @functools.wraps(method)
+        def cached(*args: Any, **kwargs: Any) -> Any:
+            key = (args, tuple(sorted(kwargs.items())))
+            now = time.monotonic()
+
+            hit = cache.get(key)
+            if hit is not None and hit[0] > now:
+                return hit[1]
+
+            value = method(*args, **kwargs)
+
+            # drop dead entries on insert so a long-running quote loop (where
+            # qty varies on every call) doesn't grow the cache without bound or
+            # pin old instances alive through their keys
+            for stale in [k for k, (expiry, _) in cache.items() if expiry <= now]:
+                del cache[stale]
+
+            cache[key] = (now + seconds, value)
+            return value
+
+        cached.cache = cache
+        return cached
+
+    return decorator
+
+
 def check_approval(method: Callable) -> Callable:
     """
     Decorator to check if user is approved for a token. It approves them if they
@@ -63,14 +132,20 @@ def check_approval(method: Callable) -> Callable:
         if method.__name__ == "make_trade" or method.__name__ == "make_trade_output":
             token_two = args[1] if args[1] != ETH_ADDRESS else None
 
-        if token:
-            is_approved = self._is_approved(token)
-            if not is_approved:
-                self.approve(token)
-        if token_two:
-            is_approved = self._is_approved(token_two)
-            if not is_approved:
-                self.approve(token_two)
+        for t in (token, token_two):
+            if not t:
+                continue
+
+            # approval can only grow once granted, so a token already in the
+            # instance's approved set skips the allowance RPC entirely
+            t_str = addr_to_str(t)
+            if t_str in self._approved_tokens:
+                continue
+
+            if not self._is_approved(t):
+                self.approve(t)
+            self._approved_tokens.add(t_str)
+
         return method(self, *args, **kwargs)
 
     return approved